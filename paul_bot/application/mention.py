@@ -3,7 +3,7 @@ from typing import Iterable, Union
 import disnake
 
 
-@dataclass
+@dataclass(slots=True)
 class Mention:
     prefix: str
     mentioned_id: int
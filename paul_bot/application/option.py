@@ -9,6 +9,16 @@ if TYPE_CHECKING:
 class Option:
     """Represents an option that a user can choose in a poll."""
 
+    __slots__ = (
+        "__option_id",
+        "__label",
+        "__votes",
+        "__votes_frozen",
+        "__poll",
+        "__index",
+        "__author_id",
+    )
+
     def __init__(
         self,
         option_id: Optional[int],
@@ -21,6 +31,7 @@ class Option:
         self.__option_id = option_id
         self.__label = label
         self.__votes = set(votes)
+        self.__votes_frozen: Optional[frozenset[int]] = None
         self.__poll = poll
         self.__index = index
         self.__author_id = author_id
@@ -41,9 +52,11 @@ class Option:
         return self.__label
 
     @property
-    def votes(self) -> set[int]:
+    def votes(self) -> frozenset[int]:
         """The set of IDs of members who voted on this option."""
-        return self.__votes.copy()
+        if self.__votes_frozen is None:
+            self.__votes_frozen = frozenset(self.__votes)
+        return self.__votes_frozen
 
     @property
     def poll(self) -> "Poll":
@@ -73,7 +86,10 @@ class Option:
         Args:
             voter_id: The ID of the user whose vote is to be removed.
         """
-        self.__votes.discard(voter_id)
+        if voter_id in self.__votes:
+            self.__votes.remove(voter_id)
+            self.__votes_frozen = None
+            self.poll.mark_changed()
 
     def delete_vote(self, voter_id: int):
         """Delete a vote from the given user on this option. If no such vote exists, nothing happens.
@@ -96,10 +112,19 @@ class Option:
         Args:
             voter_id: The ID of the user whose vote is to be added.
         """
-        if not self.poll.allow_multiple_votes:
+        if self.poll.allow_multiple_votes:
+            asyncio.create_task(data.cruds.votes_crud.add(self.option_id, voter_id))
+        else:
+            asyncio.create_task(
+                data.cruds.votes_crud.replace_users_votes_in_poll(
+                    self.poll.poll_id, self.option_id, voter_id
+                )
+            )
             self.poll.remove_votes_from(voter_id)
-        asyncio.create_task(data.cruds.votes_crud.add(self.option_id, voter_id))
-        self.__votes.add(voter_id)
+        if voter_id not in self.__votes:
+            self.__votes.add(voter_id)
+            self.__votes_frozen = None
+            self.poll.mark_changed()
 
     def toggle_vote(self, voter_id: int):
         """Toggle a user's vote on this option. If adding their vote would cause too many votes from the same user, the rest of their votes are removed.
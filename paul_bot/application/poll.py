@@ -44,6 +44,7 @@ class Poll:
         self.__channel_id = channel_id
         self.__closed = closed
         self.__options: list[Option] = []
+        self.__version = 0
 
     @property
     def poll_id(self) -> int:
@@ -110,6 +111,11 @@ class Poll:
         """Get the sum of the number of votes cast for each option."""
         return sum(option.vote_count for option in self.options)
 
+    @property
+    def version(self) -> int:
+        """A number which changes whenever the poll or any of its options change."""
+        return self.__version
+
     @property
     def message_id(self) -> int:
         """The ID of the message containing the poll."""
@@ -145,6 +151,8 @@ class Poll:
         now = datetime.now(pytz.utc)
         if not self.is_expired:
             self.__expires = now
+        self.__closed = True
+        self.mark_changed()
         asyncio.create_task(data.cruds.polls_crud.update_expiry(self, now, closed=True))
 
     def delete(self):
@@ -157,18 +165,22 @@ class Poll:
     def remove_votes_from(self, voter_id: int):
         """Remove all votes from the given user on this poll.
 
+        This method does not remove the votes from the database, so it should only be used once they have been (or are being) removed from the database some other way.
+
         Args:
             voter_id: The ID of the user whose votes should be removed.
         """
-        asyncio.create_task(
-            data.cruds.votes_crud.delete_users_votes_from_poll(self.poll_id, voter_id)
-        )
         for option in self.options:
             option.remove_vote(voter_id)
 
     def add_option(self, option: Option):
         """Add option objects to the poll."""
         self.__options.append(option)
+        self.mark_changed()
+
+    def mark_changed(self):
+        """Increment the poll's version, so that anything cached for the previous version is discarded."""
+        self.__version += 1
 
     @classmethod
     async def create_poll(
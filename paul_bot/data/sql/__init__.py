@@ -1,4 +1,5 @@
 from .delete import delete
 from .update import update
+from .execute import execute
 from . import insert
 from . import select
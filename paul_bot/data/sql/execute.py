@@ -0,0 +1,16 @@
+import asyncpg
+
+
+async def execute(pool: asyncpg.Pool, query: str, *values):
+    """Execute a query which cannot be built with the other helpers of this package, such as one with a CTE.
+
+    For security reasons it is important that the only user input passed into this function is via `*values`.
+
+    Args:
+            pool (asyncpg.Pool): The connection pool to send the query to.
+            query (str): The query to execute, using placeholders such as $1, $2, etc. for the values.
+            *values: The values to substitute for the query's placeholders.
+    """
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute(query, *values)
@@ -16,18 +16,26 @@ class VotesCrud(Crud):
             voter_id=voter_id,
         )
 
-    async def delete_users_votes_from_poll(self, poll_id: int, voter_id: int):
-        """Delete all votes from the given user on the given poll.
+    async def replace_users_votes_in_poll(
+        self, poll_id: int, option_id: int, voter_id: int
+    ):
+        """Replace all votes from the given user on the given poll with a single vote on the given option, in one statement.
 
         Args:
-                poll_id (int): The poll ID to delete votes from.
-                voter_id (int): The ID of the user whose votes to delete.
+                poll_id (int): The ID of the poll that the option belongs to.
+                option_id (int): The ID of the option to vote for.
+                voter_id (int): The ID of the user who is voting.
         """
-        await sql.delete(
+        await sql.execute(
             self.pool,
-            "votes",
-            f"option_id in (select id from options where poll_id = {poll_id})",
-            voter_id=voter_id,
+            "WITH deleted AS ("
+            "DELETE FROM votes WHERE voter_id = $1 AND option_id <> $3"
+            " AND option_id IN (SELECT id FROM options WHERE poll_id = $2)"
+            ") INSERT INTO votes (option_id, voter_id) VALUES ($3, $1)"
+            " ON CONFLICT DO NOTHING",
+            voter_id,
+            poll_id,
+            option_id,
         )
 
     async def delete_users_votes_from_option(self, option_id: int, voter_id: int):
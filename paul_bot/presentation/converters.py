@@ -1,30 +1,45 @@
-from typing import Callable
+from typing import TYPE_CHECKING, Callable, Optional
 from disnake.interactions import ApplicationCommandInteraction as Interaction
 import pytz
 from datetime import datetime, timedelta
-import dateparser
-import re
+import functools
 import logging
+
+try:
+    # google-re2 is optional, but scans in linear time when it is installed
+    import re2 as _re
+except ImportError:
+    # The stdlib engine backtracks and its \d also matches non-ASCII digits, whereas
+    # RE2's \d is ASCII-only. The patterns below spell digits as [0-9] so that both
+    # engines accept exactly the same inputs.
+    import re as _re
 from .errors import FriendlyError
 from ..application import Poll, Mention
 
+if TYPE_CHECKING:
+    from dateparser.date import DateDataParser
+
 logger = logging.getLogger(__name__)
 
 
 def parse_options(sep: str = "|") -> Callable[[Interaction, str], list[str]]:
     def converter(inter: Interaction, options: str) -> list[str]:
-        result = [option.strip() for option in options.split(sep) if option]
-        if len(result) > Poll.MAX_OPTIONS:
-            raise FriendlyError(
-                f'Too many options. Maximum is {Poll.MAX_OPTIONS}.\nOptions: "{result}"',
-                inter,
-            )
-        for option in result:
+        result = []
+        for option in options.split(sep):
+            if not option:
+                continue
+            option = option.strip()
+            if len(result) == Poll.MAX_OPTIONS:
+                raise FriendlyError(
+                    f'Too many options. Maximum is {Poll.MAX_OPTIONS}.\nOptions: "{options}"',
+                    inter,
+                )
             if len(option) > Poll.MAX_OPTION_LENGTH:
                 raise FriendlyError(
                     f'Option "{option}" is too long. Maximum is {Poll.MAX_OPTION_LENGTH} characters.',
                     inter,
                 )
+            result.append(option)
         if not result:
             logger.warning(
                 f'Unable to parse any options out of the input string "{options}".'
@@ -36,14 +51,103 @@ def parse_options(sep: str = "|") -> Callable[[Interaction, str], list[str]]:
     return converter
 
 
-RELATIVE_DATE_PARSE_FIX = re.compile(r"([dhms])(\d)")
-
-
 def parse_expires(inter: Interaction, expires: str) -> datetime:
-    # Workaround for https://github.com/scrapinghub/dateparser/issues/1012
-    expires = RELATIVE_DATE_PARSE_FIX.sub(r"\1 \2", expires)
-    result = dateparser.parse(
-        expires,
+    normalized = _fix_relative_date(expires)
+    now = datetime.now(pytz.utc)
+    result = (
+        _parse_iso_datetime(expires)
+        or _parse_relative_duration(normalized, now)
+        or _parse_with_dateparser(normalized)
+    )
+    if result is None:
+        raise FriendlyError(f'Could not parse "{normalized}" as a date/time.', inter)
+    return result
+
+
+RELATIVE_DURATION = _re.compile(r"(?:[0-9]+ ?[wdhms] ?)+")
+RELATIVE_DURATION_PART = _re.compile(r"([0-9]+) ?([wdhms])")
+TIME_UNITS = {
+    "w": "weeks",
+    "d": "days",
+    "h": "hours",
+    "m": "minutes",
+    "s": "seconds",
+}
+
+
+def _fix_relative_date(expires: str) -> str:
+    """Insert a space between a time unit and a digit that follows it, e.g. "1h20m" becomes "1h 20m".
+
+    Workaround for https://github.com/scrapinghub/dateparser/issues/1012
+    """
+    if not any(unit in expires for unit in "dhms"):
+        return expires
+    chars = []
+    previous = ""
+    for char in expires:
+        if previous in ("d", "h", "m", "s") and char.isdigit():
+            chars.append(" ")
+        chars.append(char)
+        previous = char
+    return "".join(chars)
+
+
+def _parse_iso_datetime(expires: str) -> Optional[datetime]:
+    """Parse an ISO 8601 date/time without going through dateparser. Naive datetimes are assumed to be in UTC, and aware ones are converted to UTC.
+
+    Returns:
+        The parsed timezone aware datetime, or None if the string is not in ISO format.
+    """
+    try:
+        result = datetime.fromisoformat(expires.strip())
+    except ValueError:
+        return None
+    try:
+        return (
+            result.replace(tzinfo=pytz.utc)
+            if result.tzinfo is None
+            else result.astimezone(pytz.utc)
+        )
+    except OverflowError:
+        return None
+
+
+def _parse_relative_duration(normalized: str, now: datetime) -> Optional[datetime]:
+    """Parse a purely relative duration such as "1d 2h 30m" without going through dateparser.
+
+    Args:
+        normalized: The expiry string, after applying `_fix_relative_date`.
+        now: The timezone aware time which the duration is relative to.
+
+    Returns:
+        The timezone aware datetime that the duration ends at, or None if the string is not a pure duration.
+    """
+    normalized = normalized.strip()
+    if not RELATIVE_DURATION.fullmatch(normalized):
+        return None
+    try:
+        delta = sum(
+            (
+                timedelta(**{TIME_UNITS[unit]: int(amount)})
+                for amount, unit in RELATIVE_DURATION_PART.findall(normalized)
+            ),
+            timedelta(),
+        )
+        return now + delta
+    except OverflowError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _date_parser() -> "DateDataParser":
+    """Get the dateparser parser shared by all calls to `parse_expires`, creating it on first use.
+
+    dateparser is slow to import, so it is only imported once an expiry actually needs it.
+    """
+    from dateparser.date import DateDataParser
+
+    return DateDataParser(
+        languages=["en"],
         settings={
             "PREFER_DATES_FROM": "future",
             "RETURN_AS_TIMEZONE_AWARE": True,
@@ -51,8 +155,20 @@ def parse_expires(inter: Interaction, expires: str) -> datetime:
             "TIMEZONE": "UTC",
         },
     )
+
+
+def _parse_with_dateparser(normalized: str) -> Optional[datetime]:
+    """Parse a normalized expiry string with dateparser.
+
+    Args:
+        normalized: The expiry string, after applying `_fix_relative_date`.
+
+    Returns:
+        The parsed timezone aware datetime, or None if it could not be parsed.
+    """
+    result = _date_parser().get_date_data(normalized).date_obj
     if result is None:
-        raise FriendlyError(f'Could not parse "{expires}" as a date/time.', inter)
+        return None
     return (
         result.replace(tzinfo=pytz.utc)
         if result.tzinfo is None or result.tzinfo.utcoffset(result) is None
@@ -61,41 +177,35 @@ def parse_expires(inter: Interaction, expires: str) -> datetime:
 
 
 def parse_interval(inter: Interaction, interval: str) -> timedelta:
-    conversion = {
-        'w': 'weeks',
-        'd': 'days',
-        'h': 'hours',
-        'm': 'minutes',
-        's': 'seconds',
-    }
     try:
-        parameters = {conversion[part[-1]]: float(part[:-1]) for part in interval.strip().split(' ')}
+        parameters = {TIME_UNITS[part[-1]]: float(part[:-1]) for part in interval.strip().split(' ')}
         return timedelta(**parameters)
     except IndexError | ValueError:
         raise FriendlyError(f'Could not parse "{interval}" as time interval', inter)
 
 
-MENTION_REGEX = re.compile(r"<(@[!&])?(\d+)>")
+MENTION_REGEX = _re.compile(r"<(@[!&])?([0-9]+)>|@everyone")
 
 
 def parse_mentions(inter: Interaction, string: str) -> list[Mention]:
-    string = (
-        string.replace("@everyone", f"<@&{inter.guild.default_role.id}>")
-        if inter.guild
-        else string
-    )
-    return [
-        Mention(prefix, int(mention_id))
-        for prefix, mention_id in MENTION_REGEX.findall(string)
-    ]
+    if "<" not in string and (not inter.guild or "@everyone" not in string):
+        return []
+    mentions = []
+    for match in MENTION_REGEX.finditer(string):
+        if match.group(2) is not None:
+            mentions.append(Mention(match.group(1) or "", int(match.group(2))))
+        elif inter.guild:
+            mentions.append(Mention("@&", inter.guild.default_role.id))
+    return mentions
 
 
 def length_bound_str(max: int, min: int = 0):
     def converter(inter: Interaction, string: str) -> str:
-        if len(string) > max or len(string) < min:
+        length = len(string)
+        if not min <= length <= max:
             raise FriendlyError(
                 f"Expected a string of length between {min} and {max}"
-                f' characters.\nInstead got "{string}" which is {len(string)}'
+                f' characters.\nInstead got "{string}" which is {length}'
                 " characters.",
                 inter,
             )
@@ -22,9 +22,10 @@ class PollEmbed(PollEmbedBase):
         Args:
                 poll (Poll): The poll to create an embed for.
         """
+        vote_count = poll.vote_count
         super().__init__(
             poll.question,
-            f"*{poll.vote_count} vote{'s' if poll.vote_count != 1 else ''}*",
+            f"*{vote_count} vote{'s' if vote_count != 1 else ''}*",
         )
         self.poll = poll
         self.__vote_bar_background = "⬛"
@@ -61,11 +62,12 @@ class PollEmbed(PollEmbedBase):
 
     def add_options(self):
         prefixes = self.option_prefixes()
+        total_votes = self.poll.vote_count
         for i, option in enumerate(self.poll.options):
             self.add_field(
                 name=f"{next(prefixes)} {option.label}",
                 value=self.vote_bar(
-                    i, option.vote_count, self.poll.vote_count, option.author_id
+                    i, option.vote_count, total_votes, option.author_id
                 ),
                 inline=False,
             )
@@ -1,7 +1,9 @@
 import asyncio
+import heapq
 import pytz
 import disnake
 import logging
+from collections import OrderedDict
 from typing import Iterable, Optional
 from disnake.enums import ActivityType
 from disnake.errors import Forbidden
@@ -34,17 +36,35 @@ logger = logging.getLogger(__name__)
 
 
 class Paul(InteractionBot):
+    POLL_UPDATE_DELAY = 0.2
+    POLL_EMBED_CACHE_SIZE = 128
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__total_poll_count = 0
         self.__closed_poll_count = 0
         self.__activity_name = ""
         self.__on_ready_triggered = False
+        self.__poll_views: dict[int, PollView] = {}
+        self.__poll_embeds: OrderedDict[
+            int, tuple[int, bool, PollEmbed]
+        ] = OrderedDict()
+        self.__pending_updates: set[int] = set()
+        self.__update_tasks: set[asyncio.Task] = set()
+        self.__close_queue: list[tuple[datetime, int, Poll]] = []
+        self.__close_queue_changed = asyncio.Event()
+        self.__scheduled_closes: set[int] = set()
+        self.__close_polls_task: Optional[asyncio.Task] = None
+        self.__close_tasks: set[asyncio.Task] = set()
 
         @self.event
         async def on_ready():
             if not self.__on_ready_triggered:
                 logger.info(f"\n{self.user.name} has connected to Discord!\n")
+                if self.__close_polls_task is None:
+                    self.__close_polls_task = asyncio.create_task(
+                        self.__close_polls_when_expired()
+                    )
                 await self.__load_polls()
                 await self.__set_presence()
                 self.__on_ready_triggered = True
@@ -150,9 +170,15 @@ class Paul(InteractionBot):
             poll: The poll to close.
             message: The message that triggered the poll to close. If omitted, it will be fetched from Discord's API.
         """
+        if not poll.is_opened:
+            return
         logger.debug(f"Closing poll {poll.question}.")
         poll.close()
+        self.__poll_views.pop(poll.poll_id, None)
         await self.__update_poll_message(poll, message)
+        # A closed poll's message is not edited again, so its cached renderings aren't needed anymore
+        self.__poll_embeds.pop(poll.poll_id, None)
+        self.__poll_views.pop(poll.poll_id, None)
         self.__closed_poll_count += 1
         await self.__set_presence()
 
@@ -183,7 +209,7 @@ class Paul(InteractionBot):
             self.__total_poll_count += 1
             await self.__update_poll_message(poll, message)
             await self.__set_presence()
-            asyncio.create_task(self.__poll_close_task(poll))
+            self.__schedule_poll_close(poll)
         except RuntimeError as e:
             await message.edit(
                 embed=PollEmbedBase(
@@ -211,6 +237,7 @@ class Paul(InteractionBot):
         if len(poll.options) == Poll.MAX_OPTIONS:
             raise FriendlyError("You can't add more options to this poll.", inter)
         await poll.new_option(label, author_id)
+        self.__poll_views.pop(poll.poll_id, None)
         await self.__update_poll_message(poll, inter.message)
         logger.debug(f"Added option {label} to poll {poll.question}")
 
@@ -222,7 +249,7 @@ class Paul(InteractionBot):
             voter_id: The ID of the user who voted.
         """
         option.toggle_vote(voter_id)
-        await self.__update_poll_message(option.poll)
+        self.__schedule_poll_message_update(option.poll)
 
     async def __load_polls(self):
         """Fetch the polls from the database and set up the bot to react to poll interactions."""
@@ -230,27 +257,63 @@ class Paul(InteractionBot):
         for poll in await Poll.fetch_polls():
             self.__total_poll_count += 1
             if poll.is_opened:
-                asyncio.create_task(self.__poll_close_task(poll))
+                self.__schedule_poll_close(poll)
             else:
                 self.__closed_poll_count += 1
-            self.add_view(PollView(self, poll))
+            self.add_view(self.__poll_view(poll))
         logger.info(
             f"Finished loading {self.__total_poll_count} polls. ({(datetime.now() - start).seconds}s)"
         )
 
-    async def __poll_close_task(self, poll: Poll, message: Optional[Message] = None):
-        """Close a poll at a specific time.
-
-        This function blocks until the poll is closed if awaited, so you probably want to make it run in the background instead.
+    def __schedule_poll_close(self, poll: Poll):
+        """Schedule the poll to be closed when it expires. If the poll doesn't expire or is already scheduled, nothing happens.
 
         Args:
             poll: The poll to close.
-            message: The message that triggered the poll to close. If omitted, it will be fetched from Discord's API.
         """
-        if poll.expires is None:
+        if poll.expires is None or poll.poll_id in self.__scheduled_closes:
+            return
+        self.__scheduled_closes.add(poll.poll_id)
+        heapq.heappush(self.__close_queue, (poll.expires, poll.poll_id, poll))
+        self.__close_queue_changed.set()
+
+    async def __close_polls_when_expired(self):
+        """Close each scheduled poll once it expires, in order of expiry.
+
+        A single task runs this for the lifetime of the bot, instead of one sleeping task per open poll. Errors are handled per poll so that one failure doesn't stop the remaining polls from closing.
+        """
+        while True:
+            try:
+                await self.__close_next_expired_poll()
+            except Exception as e:
+                await handle_error(e)
+
+    async def __close_next_expired_poll(self):
+        """Wait until the earliest scheduled poll expires or the schedule changes, and close that poll if it has expired."""
+        self.__close_queue_changed.clear()
+        if not self.__close_queue:
+            await self.__close_queue_changed.wait()
+            return
+        expires, poll_id, poll = self.__close_queue[0]
+        delay = (expires - datetime.now(pytz.utc)).total_seconds()
+        if delay > 0:
+            try:
+                await asyncio.wait_for(self.__close_queue_changed.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
             return
-        await asyncio.sleep((poll.expires - datetime.now(pytz.utc)).total_seconds())
-        await self.close_poll_now(poll, message)
+        heapq.heappop(self.__close_queue)
+        self.__scheduled_closes.discard(poll_id)
+        if poll.is_opened:
+            task = asyncio.create_task(self.__close_expired_poll(poll))
+            self.__close_tasks.add(task)
+            task.add_done_callback(self.__close_tasks.discard)
+
+    async def __close_expired_poll(self, poll: Poll):
+        try:
+            await self.close_poll_now(poll)
+        except Exception as e:
+            await handle_error(e)
 
     async def __update_poll_message(
         self, poll: Poll, message: Optional[Message] = None
@@ -264,12 +327,71 @@ class Paul(InteractionBot):
         try:
             message = message or await self.__get_poll_message(poll)
             await message.edit(
-                embed=PollClosedEmbed(poll) if poll.is_expired else PollEmbed(poll),
-                view=PollView(self, poll),
+                embed=self.__poll_embed(poll),
+                view=self.__poll_view(poll),
             )
         except Forbidden:
             pass
 
+    def __poll_embed(self, poll: Poll) -> PollEmbed:
+        """Get the embed for the given poll, only rendering it again if the poll changed since it was last rendered.
+
+        Only the embeds of the `POLL_EMBED_CACHE_SIZE` most recently rendered polls are kept.
+
+        Args:
+            poll: The poll to get the embed of.
+        """
+        is_expired = poll.is_expired
+        cached = self.__poll_embeds.get(poll.poll_id)
+        if cached is not None and cached[:2] == (poll.version, is_expired):
+            self.__poll_embeds.move_to_end(poll.poll_id)
+            return cached[2]
+        embed = PollClosedEmbed(poll) if is_expired else PollEmbed(poll)
+        self.__poll_embeds[poll.poll_id] = (poll.version, is_expired, embed)
+        self.__poll_embeds.move_to_end(poll.poll_id)
+        if len(self.__poll_embeds) > self.POLL_EMBED_CACHE_SIZE:
+            self.__poll_embeds.popitem(last=False)
+        return embed
+
+    def __poll_view(self, poll: Poll) -> PollView:
+        """Get the view for the given poll, constructing it if it hasn't been constructed yet.
+
+        The view only needs to be rebuilt when the poll's buttons change, i.e. when an option is added or the poll is closed, in which case the cached view must be discarded first.
+
+        Args:
+            poll: The poll to get the view of.
+        """
+        view = self.__poll_views.get(poll.poll_id)
+        if view is None:
+            view = self.__poll_views[poll.poll_id] = PollView(self, poll)
+        return view
+
+    def __schedule_poll_message_update(self, poll: Poll):
+        """Update the poll's message after `POLL_UPDATE_DELAY` seconds, unless an update is already scheduled.
+
+        Changes made to the poll before the scheduled update runs are all shown by that one update, so bursts of votes only cause a single message edit.
+
+        Args:
+            poll: The poll whose message should be updated.
+        """
+        if poll.poll_id in self.__pending_updates:
+            return
+        self.__pending_updates.add(poll.poll_id)
+        task = asyncio.create_task(self.__run_scheduled_update(poll))
+        self.__update_tasks.add(task)
+        task.add_done_callback(self.__update_tasks.discard)
+
+    async def __run_scheduled_update(self, poll: Poll):
+        await asyncio.sleep(self.POLL_UPDATE_DELAY)
+        self.__pending_updates.discard(poll.poll_id)
+        # close_poll_now already made the final edit of a closed poll
+        if not poll.is_opened:
+            return
+        try:
+            await self.__update_poll_message(poll)
+        except Exception as e:
+            await handle_error(e)
+
     async def __get_poll_message(self, poll: Poll) -> Message:
         return await self.get_partial_messageable(poll.channel_id).fetch_message(
             poll.message_id